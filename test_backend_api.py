@@ -0,0 +1,101 @@
+"""Smart Shopping API tests as pytest functions, shardable with pytest-xdist
+
+Read-only tests are distributed freely across workers; the CRUD chain is pinned
+to one worker via an xdist group and ordered with pytest-dependency:
+
+    pytest -n auto --dist=loadgroup test_backend_api.py
+"""
+import asyncio
+
+import pytest
+
+from backend_test import SmartShoppingAPITester
+
+_created = {}
+
+
+@pytest.fixture(scope="session")
+def run():
+    """Drive the tester's coroutines on one event loop per worker"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def api(run):
+    """Shared tester (and HTTP/2 connection) for every test on this worker"""
+    tester = SmartShoppingAPITester()
+    run(tester.__aenter__())
+    yield tester
+    run(tester.__aexit__(None, None, None))
+
+
+@pytest.fixture
+def product_id():
+    if 'id' not in _created:
+        pytest.skip("test product was not created")
+    return _created['id']
+
+
+def test_api_root(api, run):
+    success, _ = run(api.test_api_root())
+    assert success
+
+
+def test_get_products(api, run):
+    success, data = run(api.test_get_products())
+    assert success and isinstance(data, list)
+
+
+def test_get_categories(api, run):
+    success, data = run(api.test_get_categories())
+    assert success and 'categories' in data
+
+
+def test_get_shopping_list(api, run):
+    success, data = run(api.test_get_shopping_list())
+    assert success and isinstance(data, list)
+
+
+@pytest.mark.xdist_group("crud")
+@pytest.mark.dependency(name="create_product")
+def test_create_product(api, run):
+    success, data = run(api.test_create_product())
+    assert success and 'id' in data
+    _created['id'] = data['id']
+
+
+@pytest.mark.xdist_group("crud")
+@pytest.mark.dependency(depends=["create_product"])
+def test_get_single_product(api, run, product_id):
+    success, _ = run(api.test_get_single_product(product_id))
+    assert success
+
+
+@pytest.mark.xdist_group("crud")
+@pytest.mark.dependency(depends=["create_product"])
+def test_update_product_stock(api, run, product_id):
+    success, _ = run(api.test_update_product_stock(product_id))
+    assert success
+
+
+@pytest.mark.xdist_group("crud")
+@pytest.mark.dependency(depends=["create_product"])
+def test_update_product(api, run, product_id):
+    success, _ = run(api.test_update_product(product_id))
+    assert success
+
+
+@pytest.mark.xdist_group("crud")
+@pytest.mark.dependency(depends=["create_product"])
+def test_shopping_list_after_update(api, run, product_id):
+    success, _ = run(api.test_get_shopping_list(fresh=True))
+    assert success
+
+
+@pytest.mark.xdist_group("crud")
+@pytest.mark.dependency(depends=["create_product"])
+def test_delete_product(api, run, product_id):
+    success, _ = run(api.test_delete_product(product_id))
+    assert success
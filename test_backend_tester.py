@@ -0,0 +1,241 @@
+"""Offline tests for SmartShoppingAPITester itself, using httpx.MockTransport"""
+import asyncio
+
+import httpx
+import orjson
+
+from backend_test import GET_BATCH_WINDOW, SmartShoppingAPITester
+
+
+def _run(handler, scenario, **kwargs):
+    """Run scenario(tester) against a tester whose client is served by handler"""
+    async def main():
+        tester = SmartShoppingAPITester(**{'fixtures_path': None, **kwargs})
+        await tester.__aenter__()
+        await tester.client.aclose()
+        tester.client = httpx.AsyncClient(
+            base_url=tester.base_url,
+            headers=tester._DEFAULT_HEADERS,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            return await scenario(tester)
+        finally:
+            await tester.__aexit__(None, None, None)
+    return asyncio.run(main())
+
+
+def _path(request):
+    return request.url.path[len('/api/'):]
+
+
+def _offline(request):
+    raise AssertionError(f"unexpected network call: {request.method} {request.url}")
+
+
+def test_replay_serves_recording_without_network(tmp_path):
+    fixtures_path = tmp_path / 'fixtures.json'
+
+    async def scenario(tester):
+        result = await tester.run_test("Get All Products", "GET", "products", 200)
+        return result, tester.tests_replayed, tester.test_results[0]['details']
+
+    live = _run(lambda request: httpx.Response(200, json=[{'id': '1'}]), scenario, fixtures_path=fixtures_path)
+    replayed = _run(_offline, scenario, fixtures_path=fixtures_path)
+    assert live == ((True, [{'id': '1'}]), 0, "Status: 200, Items: 1")
+    assert replayed == ((True, [{'id': '1'}]), 1, "Status: 200, Items: 1 (replayed)")
+
+
+def test_unexpected_status_is_not_recorded(tmp_path):
+    fixtures_path = tmp_path / 'fixtures.json'
+
+    async def scenario(tester):
+        return await tester.run_test("Get All Products", "GET", "products", 200)
+
+    assert _run(lambda request: httpx.Response(503), scenario, fixtures_path=fixtures_path) == (False, {})
+    assert not fixtures_path.exists()
+
+
+def test_replay_is_keyed_by_test_name(tmp_path):
+    fixtures_path = tmp_path / 'fixtures.json'
+    bodies = iter([[], [{'product_id': '1'}]])
+
+    async def record(tester):
+        await tester.test_get_shopping_list()
+        await tester.test_get_shopping_list(fresh=True)
+
+    _run(lambda request: httpx.Response(200, json=next(bodies)), record, fixtures_path=fixtures_path)
+
+    async def after_changes_only(tester):
+        return await tester.test_get_shopping_list(fresh=True)
+
+    # A worker that only runs the post-mutation check must get the post-mutation recording
+    assert _run(_offline, after_changes_only, fixtures_path=fixtures_path) == (True, [{'product_id': '1'}])
+
+
+def test_save_merges_workers_and_refresh_replaces(tmp_path):
+    fixtures_path = tmp_path / 'fixtures.json'
+
+    def ok(request):
+        return httpx.Response(200, json={'message': _path(request)})
+
+    _run(ok, lambda tester: tester.run_test("API Root", "GET", "", 200), fixtures_path=fixtures_path)
+    _run(ok, lambda tester: tester.run_test("Get Categories", "GET", "products/categories", 200),
+         fixtures_path=fixtures_path)
+    keys = orjson.loads(fixtures_path.read_bytes()).keys()
+    assert {key.split(' | ')[0] for key in keys} == {"API Root", "Get Categories"}
+
+    _run(ok, lambda tester: tester.run_test("API Root", "GET", "", 200),
+         fixtures_path=fixtures_path, refresh_fixtures=True)
+    keys = orjson.loads(fixtures_path.read_bytes()).keys()
+    assert {key.split(' | ')[0] for key in keys} == {"API Root"}
+
+
+def test_memo_serves_repeat_get_and_honours_bypass():
+    calls = []
+
+    def handler(request):
+        calls.append(_path(request))
+        return httpx.Response(200, json=[len(calls)])
+
+    async def scenario(tester):
+        first = await tester.run_test("Get All Products", "GET", "products", 200)
+        cached = await tester.run_test("Get All Products", "GET", "products", 200)
+        fresh = await tester.run_test("Get All Products", "GET", "products", 200, fresh=True)
+        after_fresh = await tester.run_test("Get All Products", "GET", "products", 200)
+        # Same path, different expectation: must not be answered from the 200 memo
+        not_found = await tester.run_test("Get Deleted Products", "GET", "products", 404)
+        return first, cached, fresh, after_fresh, not_found, tester.test_results[1]['details']
+
+    first, cached, fresh, after_fresh, not_found, cached_details = _run(handler, scenario)
+    assert first == cached == after_fresh == (True, [1])
+    assert fresh == (True, [2])
+    assert not_found == (False, {})
+    assert cached_details.endswith("(cached)")
+    assert len(calls) == 3
+
+
+def test_crud_batch_reports_unsupported_backend():
+    for status in (404, 405):
+        def handler(request):
+            return httpx.Response(status, json={'detail': 'Method Not Allowed'})
+
+        async def scenario(tester):
+            return await tester.test_crud_batch(), tester.tests_run
+
+        # No test is logged, so the caller falls back to the sequential chain
+        assert _run(handler, scenario) == (False, 0)
+
+
+def test_crud_batch_rejects_malformed_reply():
+    for reply in ([{'status': 200, 'body': {'id': 'abc'}}], ["x"] * 6, {'status': 200}, b'<html>'):
+        def handler(request):
+            if isinstance(reply, bytes):
+                return httpx.Response(200, content=reply)
+            return httpx.Response(200, json=reply)
+
+        async def scenario(tester):
+            await tester.test_crud_batch()
+            return tester.test_results
+
+        results = _run(handler, scenario)
+        assert [(result['test'], result['status']) for result in results] == [("CRUD Batch", "FAIL")]
+
+
+def test_crud_batch_logs_each_op_with_its_id():
+    def handler(request):
+        ops = orjson.loads(request.content)['ops']
+        assert [op['path'] for op in ops][:2] == ['products', 'products/{id}']
+        replies = [{'status': 200, 'body': {'id': 123456789012}} for _ in ops]
+        replies[-1] = {'status': 404, 'body': {'detail': 'Gone'}}
+        return httpx.Response(200, json=replies)
+
+    async def scenario(tester):
+        assert await tester.test_crud_batch()
+        return [(result['test'], result['status'], result['details']) for result in tester.test_results]
+
+    results = _run(handler, scenario)
+    assert len(results) == 6
+    assert results[1] == ("Get Single Product (ID: 12345678...)", "PASS", "Status: 200")
+    assert results[-1] == ("Delete Product (ID: 12345678...)", "FAIL", "Expected 200, got 404, Error: Gone")
+
+
+def test_error_body_read_is_bounded():
+    pulled = []
+
+    async def html_error_page():
+        for _ in range(1000):
+            pulled.append(100)
+            yield b'x' * 100
+
+    def handler(request):
+        return httpx.Response(500, content=html_error_page())
+
+    async def scenario(tester):
+        result = await tester.run_test("API Root", "GET", "", 200)
+        return result, tester.test_results[0]['details']
+
+    result, details = _run(handler, scenario)
+    assert result == (False, {})
+    assert details == "Expected 200, got 500, Response: " + 'x' * 100
+    assert sum(pulled) <= 300
+
+
+def _gather_gets(tester, *endpoints):
+    return asyncio.gather(*(
+        tester.run_test(f"Get {endpoint}", "GET", endpoint, 200) for endpoint in endpoints
+    ))
+
+
+def test_concurrent_gets_share_one_multi_get():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, _path(request)))
+        ops = orjson.loads(request.content)['ops']
+        return httpx.Response(200, json=[{'status': 200, 'body': {'message': op['path']}} for op in ops])
+
+    async def scenario(tester):
+        return await _gather_gets(tester, 'products', 'shopping-list', 'products/categories')
+
+    results = _run(handler, scenario)
+    assert calls == [('POST', 'batch')]
+    assert [data['message'] for _, data in results] == ['products', 'shopping-list', 'products/categories']
+
+
+def test_multi_get_falls_back_to_individual_gets():
+    for batch_reply in (httpx.Response(405), httpx.Response(200, content=b'<html>'), httpx.ConnectError("boom")):
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, _path(request)))
+            if _path(request) == 'batch':
+                if isinstance(batch_reply, Exception):
+                    raise batch_reply
+                return batch_reply
+            return httpx.Response(200, json={'message': _path(request)})
+
+        async def scenario(tester):
+            first = await _gather_gets(tester, 'products', 'shopping-list')
+            # Batching is switched off after the first failed probe
+            second = await _gather_gets(tester, 'products/categories', '')
+            return first + second
+
+        results = _run(handler, scenario)
+        assert [success for success, _ in results] == [True] * 4
+        assert [call for call in calls if call[1] == 'batch'] == [('POST', 'batch')]
+        assert len(calls) == 5
+
+
+def test_lone_get_skips_the_batch_window():
+    def handler(request):
+        return httpx.Response(200, json=[])
+
+    async def scenario(tester):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(10):
+            await tester.run_test("Get Shopping List", "GET", "shopping-list", 200, fresh=True)
+        return loop.time() - start
+
+    assert _run(handler, scenario) < 10 * GET_BATCH_WINDOW / 2